@@ -1,15 +1,26 @@
+import functools
+import re
+
 print("""Welcome to my new app! The Weight Calculator.
 This app will tell you how many plates at each standard weight you need to achieve your desired goal.""")
 
+# Digits with an optional single decimal place of 0 or 5 (e.g. 135, 47.5)
+_WEIGHT_RE = re.compile(r'\d+(?:\.[05])?')
+
+
 def get_weight():
     """This will get the weight value from the user.
     In addition, the function will check if the input is valid. The value should be positive, numeric,
     and can contain one decimal place (only 0 or 5 is allowed after the decimal point)."""
     while True:
         try:
-            user_input = input("Please enter the desired total weight (including 45lb barbell): ")
+            user_input = input("Please enter the desired total weight (including 45lb barbell): ").strip()
+
+            # Match the whole input grammar in a single pass
+            if not _WEIGHT_RE.fullmatch(user_input):
+                print("Error: Please enter a valid number with at most one decimal place (.0 or .5, e.g., 5.0 or 5.5)")
+                continue
 
-            # Check if the input is numeric and can be converted to float
             weight = float(user_input)
 
             # Check if the weight is a positive number
@@ -17,123 +28,154 @@ def get_weight():
                 print("The weight must be a positive number. Please try again.")
                 continue
 
-            if '.' in user_input:
-                # Has decimal point - check for exactly one decimal place
-                decimal_part = user_input.split('.')[1]
-                if len(decimal_part) != 1:
-                    print("Error: Please enter exactly one decimal place (e.g., 5.0 or 5.5)")
-                    continue
-                # Check if decimal is 0 or 5
-                if decimal_part not in ['0', '5']:
-                    print("Error: Decimal place must be .0 or .5 (e.g., 5.0 or 5.5)")
-                    continue
-
-                #if all checks passed, return the weight
+            #if all checks passed, return the weight
             return weight
-        
-        except ValueError:
-            print("Error: Please enter a valid number.")
+
         except KeyboardInterrupt:
             print("\nOperation cancelled by user.")
             return None
         
+# Standard barbell weight and available plate sizes (descending order for
+# the greedy algorithm). The half-pound equivalents let the breakdown run
+# in exact integer arithmetic, so no floating point rounding is needed.
+BARBELL_WEIGHT = 45.0
+PLATE_WEIGHTS = (45, 25, 10, 5, 2.5)
+_PLATE_HALF_LBS = (90, 50, 20, 10, 5)
+
+
+@functools.lru_cache(maxsize=1024)
+def _calculate_plate_counts(target_weight):
+    """
+    Break the weight above the barbell into plate counts using integer math.
+
+    Works in half-pound units so even the 2.5lb plate divides evenly.
+
+    Args:
+        target_weight (float): The desired total weight to achieve
+
+    Returns:
+        tuple: One count per entry in PLATE_WEIGHTS, followed by the
+        leftover half-pounds that could not be matched by any plate
+    """
+    remaining = int(round((target_weight - BARBELL_WEIGHT) * 2))
+    counts = []
+    for half_lbs in _PLATE_HALF_LBS:
+        count, remaining = divmod(remaining, half_lbs)
+        counts.append(count)
+    counts.append(remaining)
+    return tuple(counts)
+
+
 def calculate_plates(target_weight):
     """
     Calculate the minimum number of plates needed to achieve the target weight.
     Assumes a 45lb barbell as the starting weight.
-    
+
     Args:
         target_weight (float): The desired total weight to achieve
-        
+
     Returns:
         dict: Contains plate breakdown, actual weight achieved, and whether exact match
     """
-    # Standard barbell weight
-    barbell_weight = 45.0
-    
     # Check if target weight is less than barbell weight
-    if target_weight < barbell_weight:
+    if target_weight < BARBELL_WEIGHT:
         return {
             'plate_counts': {45: 0, 25: 0, 10: 0, 5: 0, 2.5: 0},
-            'actual_weight': barbell_weight,
+            'actual_weight': BARBELL_WEIGHT,
             'target_weight': target_weight,
             'exact_match': False,
             'total_plates': 0,
-            'barbell_weight': barbell_weight,
+            'barbell_weight': BARBELL_WEIGHT,
             'plate_weight': 0
         }
-    
-    # Available plate weights (in descending order for greedy algorithm)
-    plate_weights = [45, 25, 10, 5, 2.5]
-    
-    # Initialize plate counts
-    plate_counts = {weight: 0 for weight in plate_weights}
-    remaining_weight = target_weight - barbell_weight
-    
-    # Greedy algorithm: use largest plates first
-    for plate_weight in plate_weights:
-        if remaining_weight >= plate_weight:
-            count = int(remaining_weight // plate_weight)
-            plate_counts[plate_weight] = count
-            remaining_weight -= count * plate_weight
-            remaining_weight = round(remaining_weight, 1)  # Handle floating point precision
-    
+
+    # Greedy breakdown, largest plates first, done entirely in integers
+    *counts, leftover_half_lbs = _calculate_plate_counts(target_weight)
+    plate_counts = dict(zip(PLATE_WEIGHTS, counts))
+
     # Calculate plate weight and total weight achieved
     plate_weight = sum(count * weight for weight, count in plate_counts.items())
-    actual_weight = barbell_weight + plate_weight
+    actual_weight = BARBELL_WEIGHT + plate_weight
     
     # Check if we achieved exact match
-    exact_match = abs(actual_weight - target_weight) < 0.01
-    
+    exact_match = leftover_half_lbs == 0
+
     return {
         'plate_counts': plate_counts,
         'actual_weight': actual_weight,
         'target_weight': target_weight,
         'exact_match': exact_match,
         'total_plates': sum(plate_counts.values()),
-        'barbell_weight': barbell_weight,
+        'barbell_weight': BARBELL_WEIGHT,
         'plate_weight': plate_weight
     }
 
 
+def calculate_plates_bulk(target_weights):
+    """
+    Calculate plate counts for many target weights in one call.
+
+    Useful for precomputing a whole workout schedule without paying the
+    full dict construction of calculate_plates per target.
+
+    Args:
+        target_weights (iterable of float): Desired total weights
+
+    Returns:
+        list: One tuple of plate counts per target, ordered to match
+        PLATE_WEIGHTS; targets below the barbell weight get all zeros
+    """
+    zero_counts = (0,) * len(PLATE_WEIGHTS)
+    return [
+        zero_counts if target < BARBELL_WEIGHT else _calculate_plate_counts(target)[:-1]
+        for target in target_weights
+    ]
+
+
 def display_results(result):
     """
     Display the plate calculation results in a formatted way.
-    
+
+    Builds the whole report in memory and writes it with a single print
+    so the output is one flush instead of one per line.
+
     Args:
         result (dict): Result from calculate_plates function
     """
-    print("\n" + "="*50)
-    print("PLATE CALCULATION RESULTS")
-    print("="*50)
-    
-    print(f"Target Weight: {result['target_weight']} lbs")
-    print(f"Actual Weight: {result['actual_weight']} lbs")
-    
+    lines = []
+    lines.append("\n" + "="*50)
+    lines.append("PLATE CALCULATION RESULTS")
+    lines.append("="*50)
+
+    lines.append(f"Target Weight: {result['target_weight']} lbs")
+    lines.append(f"Actual Weight: {result['actual_weight']} lbs")
+
     if result['exact_match']:
-        print("✓ Exact match achieved!")
+        lines.append("✓ Exact match achieved!")
     else:
         difference = result['actual_weight'] - result['target_weight']
-        print(f"✗ Difference: {difference:+.1f} lbs")
-    
-    print(f"\nBarbell Weight: {result['barbell_weight']} lbs")
-    print(f"Plate Weight: {result['plate_weight']} lbs")
-    print(f"Total Plates Needed: {result['total_plates']}")
-    
+        lines.append(f"✗ Difference: {difference:+.1f} lbs")
+
+    lines.append(f"\nBarbell Weight: {result['barbell_weight']} lbs")
+    lines.append(f"Plate Weight: {result['plate_weight']} lbs")
+    lines.append(f"Total Plates Needed: {result['total_plates']}")
+
     if result['total_plates'] > 0:
-        print("\nPlate Breakdown:")
-        print("-" * 25)
-        
+        lines.append("\nPlate Breakdown:")
+        lines.append("-" * 25)
+
         for weight, count in result['plate_counts'].items():
             if count > 0:
                 total_weight = weight * count
-                print(f"{weight:4.1f} lb plates: {count:2d} × {weight:4.1f} = {total_weight:5.1f} lbs")
-        
-        print("-" * 25)
+                lines.append(f"{weight:4.1f} lb plates: {count:2d} × {weight:4.1f} = {total_weight:5.1f} lbs")
+
+        lines.append("-" * 25)
     else:
-        print("\nNo additional plates needed - barbell weight only!")
-    
-    print(f"Total Weight: {result['actual_weight']} lbs")
+        lines.append("\nNo additional plates needed - barbell weight only!")
+
+    lines.append(f"Total Weight: {result['actual_weight']} lbs")
+
+    print('\n'.join(lines))
 
 
 def get_yes_no_input(prompt):